@@ -24,19 +24,30 @@ def quaternion_conjugate(q: Quaternion) -> Quaternion:
     return Quaternion(-x, -y, -z, w)
 
 def quat_mul_vec(q: Quaternion, v: Point) -> Point:
-    q_ = [q[0], q[1], q[2], q[3]]
-    v_ = [v[0], v[1], v[2], 0.]
-    qv = quaternion_multiply(
-        quaternion_multiply(q_, v_),
-        quaternion_conjugate(q_)
-    )[:-1]
-    return Point(qv[0], qv[1], qv[2])
+    # q * (v, 0) * q* expanded, no intermediate quaternions (scales by |q|^2 for non-unit q)
+    x, y, z, w = q[0], q[1], q[2], q[3]
+    vx, vy, vz = v[0], v[1], v[2]
+    ww, xx, yy, zz = w * w, x * x, y * y, z * z
+    xy, xz, yz, wx, wy, wz = x * y, x * z, y * z, w * x, w * y, w * z
+    return Point((ww + xx - yy - zz) * vx + 2. * (xy - wz) * vy + 2. * (xz + wy) * vz,
+                 2. * (xy + wz) * vx + (ww - xx + yy - zz) * vy + 2. * (yz - wx) * vz,
+                 2. * (xz - wy) * vx + 2. * (yz + wx) * vy + (ww - xx - yy + zz) * vz)
+
+_SLERP_DOT_THRESHOLD = 0.9995  # above this a normalized lerp is as accurate as slerp and avoids arccos/sin
 
 def quaternion_slerp(q1: Quaternion, q2: Quaternion, t: float) -> Quaternion:
     q1_n = np.array(q1) / np.linalg.norm(np.array(q1))
     q2_n = np.array(q2) / np.linalg.norm(np.array(q2))
-    omega = np.arccos(np.dot(q1, q2))
-    s = np.sin((1-t)*omega)/np.sin(omega) * q1_n + np.sin(t*omega)/np.sin(omega) * q2_n
+    dot = np.dot(q1_n, q2_n)
+    if dot < 0.:  # q and -q are the same rotation, interpolate along the shorter arc
+        q2_n = -q2_n
+        dot = -dot
+    if dot > _SLERP_DOT_THRESHOLD:  # nearly parallel, normalized lerp avoids dividing by sin(omega)
+        s = (1-t) * q1_n + t * q2_n
+        s = s / np.linalg.norm(s)
+    else:
+        omega = np.arccos(dot)
+        s = np.sin((1-t)*omega)/np.sin(omega) * q1_n + np.sin(t*omega)/np.sin(omega) * q2_n
     return Quaternion(s[0], s[1], s[2], s[3])
 
 def quaternion_matrix(q: Quaternion) -> list[list[float]]:
@@ -57,8 +68,13 @@ def quaternion_matrix(q: Quaternion) -> list[list[float]]:
 
     return [[r00, r01, r02], [r10, r11, r12], [r20, r21, r22]]
 
+# np.float64 like the results of the general paths, so the return type does not depend on the input value
+_IDENTITY_Q = Quaternion(np.float64(0.), np.float64(0.), np.float64(0.), np.float64(1.))
+_ZERO_EULER = (np.float64(0.), np.float64(0.), np.float64(0.))
+
 """Below not used in the sample codes but for convenience."""
 def quaternion_from_euler(x: float, y: float, z: float) -> Quaternion:
+    if np.ndim(x) == np.ndim(y) == np.ndim(z) == 0 and not (x or y or z): return _IDENTITY_Q  # arrays take the general path
     cx = np.cos(x*.5)
     sx = np.sin(x*.5)
     cy = np.cos(y*.5)
@@ -86,29 +102,30 @@ def euler_from_matrix(m: list[list[float]]) -> tuple[float, float, float]:
     return ax, ay, az
 
 def euler_from_quaternion(q: Quaternion) -> tuple[float, float, float]:
+    if np.ndim(q[3]) == 0 and q[0] == q[1] == q[2] == 0. and abs(q[3]) == 1.: return _ZERO_EULER
     return euler_from_matrix(quaternion_matrix(q))
 
 """
 Directions to angles.
 """
 
-def proper_trifunc(src: int) -> int:
-    if src > 1:
-        return 1
-    if src < -1:
-        return -1
-    return src
-
-def xyz2polar(xyz: np.ndarray) -> tuple[float, float, float]:
-    r = np.linalg.norm(xyz)
-    dic = xyz / r
-    theta = np.arccos(proper_trifunc(dic[2]))
-    phi = np.arctan2(dic[1], dic[0])
+def proper_trifunc(src: float | np.ndarray) -> float | np.ndarray:
+    if isinstance(src, np.ndarray):
+        return np.clip(src, -1., 1.)
+    return min(max(src, -1.), 1.)  # src first so NaN propagates like np.clip
+
+def xyz2polar(xyz: np.ndarray) -> tuple[float, float, float] | tuple[np.ndarray, np.ndarray, np.ndarray]:
+    xyz = np.asarray(xyz, dtype=np.float64)  # (3,) or batched (..., 3)
+    r = np.linalg.norm(xyz, axis=-1)
+    dic = xyz / r[..., None]
+    theta = np.arccos(proper_trifunc(dic[..., 2]))
+    phi = np.arctan2(dic[..., 1], dic[..., 0])
     return r, theta, phi
 
-def xyz2dist_ang(xyz: np.ndarray) -> tuple[float, float, float]:
-    r = np.linalg.norm(xyz)
-    dic = xyz / r
-    theta = np.arcsin(proper_trifunc(dic[2]))
-    phi = np.arctan2(dic[1], dic[0])
+def xyz2dist_ang(xyz: np.ndarray) -> tuple[float, float, float] | tuple[np.ndarray, np.ndarray, np.ndarray]:
+    xyz = np.asarray(xyz, dtype=np.float64)  # (3,) or batched (..., 3)
+    r = np.linalg.norm(xyz, axis=-1)
+    dic = xyz / r[..., None]
+    theta = np.arcsin(proper_trifunc(dic[..., 2]))
+    phi = np.arctan2(dic[..., 1], dic[..., 0])
     return r, theta, phi
@@ -33,6 +33,11 @@ class Quaternion(typing.NamedTuple):  # w + xi + yj + zk
     z: float
     w: float
 
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        """Convert to a float64 (x, y, z, w) array so quaternions can be stacked into (N,4) batches."""
+        if copy is False: raise ValueError("Quaternion cannot be converted to an array without copying")
+        return np.array((self.x, self.y, self.z, self.w), dtype=dtype or np.float64)
+
 class TransformPair(typing.NamedTuple):
     base: Quaternion | list
     transform: Quaternion | list
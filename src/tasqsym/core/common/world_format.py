@@ -13,7 +13,9 @@ class CombinedRobotStruct:
     """Class to hold both the actual state and desired actions, used to pass information between engines in the execution pipeline."""
     def __init__(self, actual_states: tss_structs.CombinedRobotState, desired_actions: tss_structs.CombinedRobotAction, status: tss_structs.Status):
         self.actual_states = copy.deepcopy(actual_states)
-        self.desired_actions = copy.deepcopy(desired_actions)
+        # copy the containers only, RobotAction instances are never modified once created so they can be shared
+        self.desired_actions = tss_structs.CombinedRobotAction(
+            desired_actions.task, {unique_id: list(actions) for unique_id, actions in desired_actions.actions.items()})
         self.status = status
 
 class FunctionalStates:
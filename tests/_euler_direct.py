@@ -0,0 +1,50 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------------------------
+
+"""
+Direct quaternion to Euler angle conversion (Bernardes & Viollet, PLoS ONE 2022).
+Used as an independent reference for tasqsym.core.common.math.euler_from_quaternion,
+which goes through the rotation matrix instead.
+"""
+
+import math
+
+_AXIS = {'x': 0, 'y': 1, 'z': 2}
+_EPS = 1e-7
+
+
+def euler_from_quaternion_direct(q, seq: str = 'xyz', extrinsic: bool = True) -> tuple[float, float, float]:
+    """
+    Euler angles of the (x, y, z, w) quaternion q for the axis sequence seq.
+    Angles are returned in the order of seq, each wrapped to [-pi, pi].
+    """
+    if not extrinsic: seq = seq[::-1]  # intrinsic angles are the extrinsic ones of the reversed sequence
+    i, j, k = (_AXIS[s] for s in seq.lower())
+    proper = i == k  # proper Euler (e.g. zyz) rather than Tait-Bryan (e.g. xyz)
+    if proper: k = 3 - i - j
+    sign = (i - j) * (j - k) * (k - i) // 2
+
+    # permute the quaternion so every sequence reduces to the proper Euler case
+    if proper:
+        a, b, c, d = q[3], q[i], q[j], q[k] * sign
+    else:
+        a, b, c, d = q[3] - q[j], q[i] + q[k] * sign, q[j] + q[3], q[k] * sign - q[i]
+
+    angles = [0.0, 2. * math.atan2(math.hypot(c, d), math.hypot(a, b)), 0.0]
+    half_sum = math.atan2(b, a)
+    half_diff = math.atan2(d, c)
+    if abs(angles[1]) <= _EPS:  # gimbal lock, only the sum of the outer angles is defined
+        angles[0] = 2. * half_sum
+    elif abs(angles[1] - math.pi) <= _EPS:  # gimbal lock, only the difference is defined
+        angles[0] = -2. * half_diff
+    else:
+        angles[0] = half_sum - half_diff
+        angles[2] = half_sum + half_diff
+
+    if not proper:
+        angles[2] *= sign
+        angles[1] -= math.pi / 2
+    if not extrinsic: angles.reverse()
+    return tuple(math.remainder(angle, 2. * math.pi) for angle in angles)
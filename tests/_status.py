@@ -0,0 +1,12 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------------------------
+
+"""Shared Status instances for the fakes and tests. Only ever read, never mutated."""
+
+import tasqsym.core.common.constants as tss_constants
+import tasqsym.core.common.structs as tss_structs
+
+OK = tss_structs.Status(tss_constants.StatusFlags.SUCCESS)
+FAIL = tss_structs.Status(tss_constants.StatusFlags.FAILED)
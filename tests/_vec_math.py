@@ -0,0 +1,32 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------------------------
+
+"""
+Batched reference implementations of the quaternion routines in tasqsym.core.common.math.
+Quaternions are stacked as (N,4) arrays in (x, y, z, w) order, vectors as (N,3) arrays.
+"""
+
+import numpy as np
+
+
+def vec_quaternion_multiply(Q1: np.ndarray, Q2: np.ndarray) -> np.ndarray:
+    """Hamilton product of each row pair, one pass per operation over the whole batch."""
+    Q1 = np.asarray(Q1, dtype=np.float64)
+    Q2 = np.asarray(Q2, dtype=np.float64)
+    u1, w1 = Q1[:, :3], Q1[:, 3]
+    u2, w2 = Q2[:, :3], Q2[:, 3]
+    out = np.empty(np.broadcast_shapes(Q1.shape, Q2.shape))
+    out[:, :3] = w1[:, None] * u2 + w2[:, None] * u1 + np.cross(u1, u2)
+    out[:, 3] = w1 * w2 - np.einsum('ij,ij->i', u1, u2)
+    return out
+
+
+def vec_quat_mul_vec(Q: np.ndarray, V: np.ndarray) -> np.ndarray:
+    """Rotate each vector by its unit quaternion: v' = v + 2w(u x v) + 2u x (u x v)."""
+    Q = np.asarray(Q, dtype=np.float64)
+    V = np.asarray(V, dtype=np.float64)
+    u, w = Q[:, :3], Q[:, 3:]
+    uv = np.cross(u, V)
+    return V + 2. * w * uv + 2. * np.cross(u, uv)
@@ -0,0 +1,52 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------------------------
+
+"""
+Micro-benchmarks for the quaternion routines in tasqsym.core.common.math.
+Not collected by default (python_files = test_*.py), run them explicitly:
+    pytest tests/bench_math.py --benchmark-only
+"""
+
+import pytest
+import numpy as np
+
+pytest.importorskip("pytest_benchmark")
+
+import tasqsym.core.common.math as tss_math
+import tasqsym.core.common.structs as tss_structs
+from tests._vec_math import vec_quaternion_multiply
+
+_IDENTITY_Q = tss_structs.Quaternion(0, 0, 0, 1)
+_Q = tss_structs.Quaternion(1, 2, 3, 4)
+_Z90_Q = tss_structs.Quaternion(0, 0, np.sqrt(2)/2, np.sqrt(2)/2)
+
+_N = 1024
+_rng = np.random.default_rng(0)
+_Q1 = _rng.standard_normal((_N, 4))
+_Q1 /= np.linalg.norm(_Q1, axis=1, keepdims=True)
+_Q2 = _rng.standard_normal((_N, 4))
+_Q2 /= np.linalg.norm(_Q2, axis=1, keepdims=True)
+
+
+def test_bench_quat_mul(benchmark):
+    benchmark(tss_math.quaternion_multiply, _IDENTITY_Q, _Q)
+
+
+def test_bench_quat_mul_loop(benchmark):
+    """Baseline for the batched version below: one scalar call per row."""
+    benchmark(lambda: [tss_math.quaternion_multiply(q1, q2) for q1, q2 in zip(_Q1, _Q2)])
+
+
+def test_bench_quat_mul_batched(benchmark):
+    benchmark(vec_quaternion_multiply, _Q1, _Q2)
+
+
+def test_bench_slerp(benchmark):
+    benchmark(tss_math.quaternion_slerp, _IDENTITY_Q, _Z90_Q, 0.5)
+
+
+def test_bench_slerp_near_identical(benchmark):
+    """Exercises the normalized lerp fallback."""
+    benchmark(tss_math.quaternion_slerp, _IDENTITY_Q, tss_structs.Quaternion(0, 0, 0.01, 1), 0.5)
@@ -0,0 +1,138 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------------------------
+
+"""Shared fixtures for the test suite."""
+
+import os
+import json
+import mmap
+import functools
+import contextlib
+import importlib
+from types import SimpleNamespace
+
+import pytest
+import numpy as np
+
+import tasqsym.core.common.structs as tss_structs
+from tests._status import OK
+
+try:
+    import orjson  # faster parser for the sample files when available
+
+    def _parse_mapped(mm: mmap.mmap) -> dict:
+        with memoryview(mm) as buf:  # release the export before the map is closed
+            return orjson.loads(buf)
+except ImportError:
+    def _parse_mapped(mm: mmap.mmap) -> dict:
+        return json.loads(mm[:])
+
+_HERE = os.path.dirname(__file__)
+SAMPLE_CFG = os.path.join(_HERE, '../src/tasqsym_samples/sim_robot_sample_settings.json')
+SAMPLE_BT = os.path.join(_HERE, '../src/tasqsym_samples/generated_sequence_samples/throw_away_the_trash.json')
+
+
+def pytest_addoption(parser):
+    parser.addoption("--run-async", action="store_true", default=False,
+                     help="run tests marked async_heavy (skipped by default)")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-async"): return
+    skip_async = pytest.mark.skip(reason="async_heavy test, pass --run-async to run")
+    for item in items:
+        if "async_heavy" in item.keywords: item.add_marker(skip_async)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_json(path: str) -> dict:
+    """Parse a JSON file once and memoize the result. Callers must not mutate it."""
+    try:
+        f = open(path, 'rb')
+    except FileNotFoundError:
+        pytest.fail(f"Sample file not found: {path}")
+    with f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return _parse_mapped(mm)
+
+
+@pytest.fixture(scope="session")
+def sample_sim_config() -> dict:
+    """Parsed sim robot sample settings, read once per session. Do not mutate."""
+    return _load_json(SAMPLE_CFG)
+
+
+@pytest.fixture(scope="session")
+def sample_behavior_tree() -> dict:
+    """Parsed throw-away-the-trash behavior tree, read once per session. Do not mutate."""
+    return _load_json(SAMPLE_BT)
+
+
+@pytest.fixture
+def rng() -> np.random.Generator:
+    """A freshly seeded generator per test, so draws do not depend on which tests ran before."""
+    return np.random.default_rng(0xC0FFEE)
+
+
+@contextlib.contextmanager
+def fast_patch(obj, name: str, new):
+    """Swap obj.name for new and restore it on exit, without unittest.mock machinery."""
+    old = getattr(obj, name)
+    setattr(obj, name, new)
+    try:
+        yield new
+    finally:
+        setattr(obj, name, old)
+
+
+@pytest.fixture(scope="module")
+def envg():
+    """A shared EngineInterface for tests that never call its real init()."""
+    import tasqsym.core.interface.envg_interface as envg_interface
+    return envg_interface.EngineInterface()
+
+
+@pytest.fixture(scope="module")
+def rsi():
+    """A shared SkillInterface for tests that never call its real init()."""
+    import tasqsym.core.interface.skill_interface as skill_interface
+    return skill_interface.SkillInterface()
+
+
+@pytest.fixture
+def board():
+    """A fresh Blackboard; function-scoped because tests write variables to it."""
+    import tasqsym.core.interface.blackboard as blackboard
+    return blackboard.Blackboard()
+
+
+async def _async_ok(*args, **kwargs) -> tss_structs.Status:
+    return OK
+
+
+def _fake_engine() -> tuple:
+    """Return an engine class stand-in and the single instance it constructs."""
+    inst = SimpleNamespace(init=_async_ok)
+    cls = lambda *args, **kwargs: inst
+    return cls, inst
+
+
+_FAKE_MODULE = SimpleNamespace(
+    library={"test_skill": "test.module"},
+    TestEngine=_fake_engine()[0])
+
+
+def _return_fake_module(name: str, package: str = None) -> SimpleNamespace:
+    return _FAKE_MODULE
+
+
+@pytest.fixture
+def fake_importlib():
+    """
+    Patch importlib.import_module to return a fake module exposing a skill library and a
+    TestEngine class whose instances init() successfully. Function-scoped so only the tests
+    that request it see the fake; the patch is a plain setattr, so per-test setup is free.
+    """
+    with fast_patch(importlib, 'import_module', _return_fake_module) as fake_import:
+        yield fake_import
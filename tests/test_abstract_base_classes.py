@@ -249,7 +249,6 @@ class TestControllerEngineBase:
         retrieved_state = engine.getLatestRobotStates()
         assert retrieved_state == test_state
         
-    @pytest.mark.asyncio
     async def test_controller_engine_emergency_stop(self):
         """Test ControllerEngineBase emergency stop functionality."""
         implementations = {
@@ -340,7 +339,6 @@ class TestPhysicalRobot:
         with pytest.raises(NotImplementedError):
             robot.getLinkTransform("test_link")
             
-    @pytest.mark.asyncio
     async def test_physical_robot_init_method(self):
         """Test PhysicalRobot init method."""
         implementations = {
@@ -798,7 +796,6 @@ class TestControllerEnginePhysicsAndScenery:
         assert status.status == tss_constants.StatusFlags.SUCCESS
         mock_robot.getLinkTransform.assert_called_once_with("sensor_frame")
         
-    @pytest.mark.asyncio
     async def test_controller_engine_reset_and_load_components(self):
         """Test ControllerEngineBase reset and loadComponents functionality."""
         implementations = {
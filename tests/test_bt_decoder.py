@@ -39,7 +39,6 @@ class TestTaskSequenceDecoder:
         
         assert decoder.network_client == mock_client
         
-    @pytest.mark.asyncio
     async def test_run_tree_basic_structure(self):
         """Test runTree with a basic behavior tree structure."""
         decoder = bt_decoder.TaskSequenceDecoder()
@@ -67,7 +66,6 @@ class TestTaskSequenceDecoder:
         assert result.status == tss_constants.StatusFlags.SUCCESS
         rsi.cleanup.assert_called_once()
         
-    @pytest.mark.asyncio
     async def test_run_tree_with_start_from_node(self):
         """Test runTree with start_from_node_id parameter."""
         decoder = bt_decoder.TaskSequenceDecoder()
@@ -96,7 +94,6 @@ class TestTaskSequenceDecoder:
         assert decoder.escape_at_node_id == escape_at_node_id
         assert result.status == tss_constants.StatusFlags.SUCCESS
         
-    @pytest.mark.asyncio
     async def test_parse_control_sequence(self):
         """Test parseControl with a Sequence node."""
         decoder = bt_decoder.TaskSequenceDecoder()
@@ -119,7 +116,6 @@ class TestTaskSequenceDecoder:
         
         assert result.status == tss_constants.StatusFlags.SUCCESS
         
-    @pytest.mark.asyncio
     async def test_parse_control_fallback(self):
         """Test parseControl with a Fallback node."""
         decoder = bt_decoder.TaskSequenceDecoder()
@@ -142,7 +138,6 @@ class TestTaskSequenceDecoder:
         
         assert result.status == tss_constants.StatusFlags.SUCCESS
         
-    @pytest.mark.asyncio
     async def test_parse_control_parallel(self):
         """Test parseControl with a Parallel node."""
         decoder = bt_decoder.TaskSequenceDecoder()
@@ -166,7 +161,6 @@ class TestTaskSequenceDecoder:
         # parseControl will return UNEXPECTED for unsupported node types
         assert result.status == tss_constants.StatusFlags.UNEXPECTED
         
-    @pytest.mark.asyncio
     async def test_parse_control_unknown_node(self):
         """Test parseControl with an unknown node type."""
         decoder = bt_decoder.TaskSequenceDecoder()
@@ -201,7 +195,6 @@ class TestTaskSequenceDecoder:
         assert decoder.log_last_executed_node_name == "test_node"
         assert decoder.log_last_executed_node_id == [1, 2, 3]
         
-    @pytest.mark.asyncio
     async def test_run_tree_error_handling(self):
         """Test runTree error handling when runSequence fails."""
         decoder = bt_decoder.TaskSequenceDecoder()
@@ -228,7 +221,6 @@ class TestTaskSequenceDecoder:
         assert "Test failure" in result.message or result.message == "Test failure"
         rsi.cleanup.assert_called_once()
         
-    @pytest.mark.asyncio
     async def test_parse_control_with_name_attribute(self):
         """Test parseControl correctly handles nodes with @name attributes."""
         decoder = bt_decoder.TaskSequenceDecoder()
@@ -252,7 +244,6 @@ class TestTaskSequenceDecoder:
         # Verify the runSequence was called with the correct child nodes
         decoder.runSequence.assert_called_once()
         
-    @pytest.mark.asyncio 
     async def test_run_tree_resets_logging(self):
         """Test that runTree resets logging attributes."""
         decoder = bt_decoder.TaskSequenceDecoder()
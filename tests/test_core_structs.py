@@ -8,6 +8,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
 
 import pytest
+import numpy as np
 import tasqsym.core.common.constants as tss_constants
 import tasqsym.core.common.structs as tss_structs
 
@@ -95,6 +96,25 @@ class TestQuaternion:
         assert quat.z == 0.0
         assert quat.w == 1.0
 
+    def test_quaternion_as_array(self):
+        """Test converting a Quaternion with integer components to a float64 array."""
+        arr = np.asarray(tss_structs.Quaternion(1, 2, 3, 4))
+        assert arr.dtype == np.float64
+        assert arr.shape == (4,)
+        np.testing.assert_array_equal(arr, [1., 2., 3., 4.])
+
+    def test_quaternion_as_array_no_copy(self):
+        """Test requesting a zero-copy array raises, since a NamedTuple has no buffer to share."""
+        with pytest.raises(ValueError):
+            np.asarray(tss_structs.Quaternion(0, 0, 0, 1), copy=False)
+
+    def test_quaternion_stack(self):
+        """Test stacking Quaternions into a contiguous (N,4) batch."""
+        quats = [tss_structs.Quaternion(0, 0, 0, 1), tss_structs.Quaternion(1, 0, 0, 0)]
+        batch = np.stack([np.asarray(q) for q in quats])
+        assert batch.shape == (2, 4)
+        assert batch.flags.c_contiguous
+
 
 class TestPose:
     """Test Pose named tuple."""
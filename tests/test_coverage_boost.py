@@ -8,7 +8,7 @@
 import pytest
 import sys
 import os
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 
 # Add src to Python path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -18,6 +18,10 @@ import tasqsym.core.interface.skill_interface as skill_interface
 import tasqsym.core.common.structs as tss_structs
 import tasqsym.core.common.constants as tss_constants
 
+SUCCESS_VAL = tss_constants.StatusFlags.SUCCESS.value
+FAILED_VAL = tss_constants.StatusFlags.FAILED.value
+UNKNOWN_VAL = tss_constants.StatusFlags.UNKNOWN.value
+
 
 class TestEnvgInterfaceExtended:
     """Extended tests for EngineInterface to increase coverage."""
@@ -204,9 +208,9 @@ class TestBasicUtilityFunctions:
     def test_constants_access(self):
         """Test accessing constants."""
         # Test status flags
-        assert tss_constants.StatusFlags.SUCCESS.value == 1
-        assert tss_constants.StatusFlags.FAILED.value == -1
-        assert tss_constants.StatusFlags.UNKNOWN.value == -6
+        assert SUCCESS_VAL == 1
+        assert FAILED_VAL == -1
+        assert UNKNOWN_VAL == -6
         
         # Test solve by types
         assert hasattr(tss_constants, 'SolveByType')
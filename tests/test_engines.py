@@ -8,7 +8,7 @@
 import pytest
 import sys
 import os
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 
 # Add src to Python path for imports  
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
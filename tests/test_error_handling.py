@@ -1,13 +1,7 @@
 """
 Tests for error handling and edge cases.
 """
-import sys
-import os
 import json
-import tempfile
-
-# Add src to Python path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
 
 import pytest
 import tasqsym.core.common.constants as tss_constants
@@ -15,25 +9,25 @@ import tasqsym.core.common.structs as tss_structs
 import tasqsym.core.interface.config_loader as config_loader
 
 
+@pytest.fixture(scope="module")
+def invalid_json_path(tmp_path_factory):
+    """A file containing malformed JSON, written once per module."""
+    path = tmp_path_factory.mktemp("bad") / "bad.json"
+    path.write_text("{ invalid json")
+    return str(path)
+
+
 class TestErrorHandling:
     """Test error handling scenarios."""
     
-    def test_config_loader_invalid_json_file(self):
+    def test_config_loader_invalid_json_file(self, invalid_json_path):
         """Test config loader with invalid JSON file."""
-        # Create a temporary file with invalid JSON
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            f.write("{ invalid json")
-            temp_file = f.name
-            
-        try:
-            cfl = config_loader.ConfigLoader()
-            configs = {"robot_structure": temp_file}
-            
-            # This should raise a JSON decode error
-            with pytest.raises(json.JSONDecodeError):
-                cfl.expandRobotStructureConfig(configs)
-        finally:
-            os.unlink(temp_file)
+        cfl = config_loader.ConfigLoader()
+        configs = {"robot_structure": invalid_json_path}
+
+        # This should raise a JSON decode error
+        with pytest.raises(json.JSONDecodeError):
+            cfl.expandRobotStructureConfig(configs)
             
     def test_status_with_all_fields(self):
         """Test Status creation with all fields."""
@@ -55,9 +49,8 @@ class TestErrorHandling:
         }
         
         data = tss_structs.Data(data_dict)
-        assert data.normal_field == "value1"
-        assert data.special_field == "value2"  # @ prefix removed
-        assert data.nested == {"key": "value"}
+        # @ prefix removed
+        assert vars(data) == {"normal_field": "value1", "special_field": "value2", "nested": {"key": "value"}}
         
     def test_robot_action_creation(self):
         """Test RobotAction creation."""
@@ -110,38 +103,19 @@ class TestBehaviorTreeValidation:
 class TestConstants:
     """Test constants and enums."""
     
-    def test_all_status_flags(self):
+    @pytest.mark.parametrize("flag", list(tss_constants.StatusFlags))
+    def test_status_flag_is_enum(self, flag):
         """Test all status flags are accessible."""
-        flags = [
-            tss_constants.StatusFlags.SUCCESS,
-            tss_constants.StatusFlags.FAILED,
-            tss_constants.StatusFlags.ABORTED,
-            tss_constants.StatusFlags.UNEXPECTED,
-            tss_constants.StatusFlags.SKIPPED,
-            tss_constants.StatusFlags.ESCAPED,
-            tss_constants.StatusFlags.UNKNOWN
-        ]
-        
-        for flag in flags:
-            assert isinstance(flag, tss_constants.StatusFlags)
-            
-    def test_status_reason_enum(self):
+        assert isinstance(flag, tss_constants.StatusFlags)
+
+    @pytest.mark.parametrize("reason", list(tss_constants.StatusReason))
+    def test_status_reason_is_enum(self, reason):
         """Test status reason enum values."""
-        reasons = [
-            tss_constants.StatusReason.NONE,
-            tss_constants.StatusReason.SUCCESSFUL_TERMINATION,
-            tss_constants.StatusReason.CONNECTION_ERROR,
-            tss_constants.StatusReason.PROCESS_FAILURE,
-            tss_constants.StatusReason.OTHER
-        ]
-        
-        for reason in reasons:
-            assert isinstance(reason, tss_constants.StatusReason)
-            
+        assert isinstance(reason, tss_constants.StatusReason)
+
     def test_solve_by_type_enum(self):
         """Test SolveByType enum."""
-        assert hasattr(tss_constants, 'SolveByType')
-        assert hasattr(tss_constants.SolveByType, 'NULL_ACTION')
+        assert isinstance(tss_constants.SolveByType.NULL_ACTION, tss_constants.SolveByType)
 
 
 class TestStructImmutability:
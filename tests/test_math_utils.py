@@ -6,43 +6,85 @@
 """Tests for tasqsym.core.common.math module."""
 
 import pytest
-import sys
-import os
-
-# Add src to Python path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import math
+import numpy as np
 
 import tasqsym.core.common.math as tss_math
 import tasqsym.core.common.structs as tss_structs
+from tests._vec_math import vec_quaternion_multiply, vec_quat_mul_vec
+from tests._euler_direct import euler_from_quaternion_direct
+
+_SQRT2_2 = math.sqrt(2)/2  # sin(pi/4) == cos(pi/4)
+_IDENTITY_Q = tss_structs.Quaternion(0, 0, 0, 1)
+_Z90_Q = tss_structs.Quaternion(0, 0, _SQRT2_2, _SQRT2_2)  # 90 degrees around z
+_EYE3 = np.eye(3)
+_EYE3.flags.writeable = False
+_UNIT_XYZ = np.asarray([[0, 0, 1], [1, 0, 0], [0, 1, 0]], dtype=np.float64)
+
+# (q1, q2, q1 * q2)
+_MULTIPLY_CASES = [
+    (_IDENTITY_Q, (1, 2, 3, 4), (1, 2, 3, 4)),  # identity quaternion
+    ((1, 0, 0, 0), (0, 1, 0, 0), (0, 0, 1, 0)),  # i * j = k
+]
+_Q1, _Q2, _Q12 = (np.array(c, dtype=np.float64) for c in zip(*_MULTIPLY_CASES))
+
+# (q, v, q v q*)
+_ROTATE_CASES = [
+    (_IDENTITY_Q, (1, 2, 3), (1, 2, 3)),  # identity quaternion should not change the vector
+    (_Z90_Q, (1, 0, 0), (0, 1, 0)),  # 90 degrees around z
+]
+_RQ, _RV, _RV_EXPECTED = (np.array(c, dtype=np.float64) for c in zip(*_ROTATE_CASES))
+
+# (t, q1, q2, slerp(q1, q2, t))
+_SLERP_CASES = [
+    (0.0, _IDENTITY_Q, (1, 0, 0, 0), _IDENTITY_Q),  # t=0 returns q1
+    (1.0, _IDENTITY_Q, (1, 0, 0, 0), (1, 0, 0, 0)),  # t=1 returns q2 (180 degrees around x)
+    (0.5, _IDENTITY_Q, (1, 0, 0, 0), (_SQRT2_2, 0, 0, _SQRT2_2)),
+    (0.5, _IDENTITY_Q, _Z90_Q, (0, 0, math.sin(math.pi/8), math.cos(math.pi/8))),
+    (0.25, _IDENTITY_Q, _Z90_Q, (0, 0, math.sin(math.pi/16), math.cos(math.pi/16))),
+]
+
+_AXIS = {'x': 0, 'y': 1, 'z': 2}
+
+# seeded random unit quaternions and vectors for the closed-form rotation check
+_rng = np.random.default_rng(20)
+_RANDOM_Q = _rng.standard_normal((20, 4))
+_RANDOM_Q /= np.linalg.norm(_RANDOM_Q, axis=1, keepdims=True)
+_RANDOM_V = _rng.standard_normal((20, 3))
+
+
+def _rot_ref(q, v) -> np.ndarray:
+    """Rotate v by the rotation matrix of the unit quaternion q = (x, y, z, w)."""
+    x, y, z, w = q
+    return np.array([
+        (w*w + x*x - y*y - z*z) * v[0] + 2*(x*y - w*z) * v[1] + 2*(x*z + w*y) * v[2],
+        2*(x*y + w*z) * v[0] + (w*w - x*x + y*y - z*z) * v[1] + 2*(y*z - w*x) * v[2],
+        2*(x*z - w*y) * v[0] + 2*(y*z + w*x) * v[1] + (w*w - x*x - y*y + z*z) * v[2]])
 
 
 class TestQuaternionMath:
     """Test quaternion mathematical operations."""
     
-    def test_quaternion_multiply_identity(self):
-        """Test quaternion multiplication with identity quaternion."""
-        q1 = tss_structs.Quaternion(0, 0, 0, 1)  # identity quaternion
-        q2 = tss_structs.Quaternion(1, 2, 3, 4)
-        
-        result = tss_math.quaternion_multiply(q1, q2)
-        
-        assert result[0] == 1
-        assert result[1] == 2 
-        assert result[2] == 3
-        assert result[3] == 4
-        
-    def test_quaternion_multiply_general(self):
-        """Test general quaternion multiplication."""
-        q1 = tss_structs.Quaternion(1, 0, 0, 0)
-        q2 = tss_structs.Quaternion(0, 1, 0, 0)
-        
-        result = tss_math.quaternion_multiply(q1, q2)
-        
-        # i * j = k
-        assert result[0] == 0  # x
-        assert result[1] == 0  # y
-        assert result[2] == 1  # z
-        assert result[3] == 0  # w
+    @pytest.mark.parametrize("q1,q2,expected", _MULTIPLY_CASES)
+    def test_quaternion_multiply(self, q1, q2, expected):
+        """Test quaternion multiplication (identity, i * j = k)."""
+        result = tss_math.quaternion_multiply(tss_structs.Quaternion(*q1), tss_structs.Quaternion(*q2))
+        np.testing.assert_allclose(result, expected, atol=1e-10)
+
+    def test_quaternion_multiply_batched(self):
+        """Test the batched Hamilton product agrees with the expected and scalar results."""
+        scalar = [tss_math.quaternion_multiply(q1, q2) for q1, q2 in zip(_Q1, _Q2)]
+        np.testing.assert_allclose(vec_quaternion_multiply(_Q1, _Q2), _Q12, atol=1e-10)
+        np.testing.assert_allclose(scalar, _Q12, atol=1e-10)
+
+    def test_quaternion_multiply_batched_random(self, rng):
+        """Test the batched Hamilton product on random unit quaternions against the scalar one."""
+        Q1 = rng.standard_normal((64, 4))
+        Q1 /= np.linalg.norm(Q1, axis=1, keepdims=True)
+        Q2 = rng.standard_normal((64, 4))
+        Q2 /= np.linalg.norm(Q2, axis=1, keepdims=True)
+        scalar = [tss_math.quaternion_multiply(q1, q2) for q1, q2 in zip(Q1, Q2)]
+        np.testing.assert_allclose(vec_quaternion_multiply(Q1, Q2), scalar, atol=1e-12)
         
     def test_quaternion_conjugate(self):
         """Test quaternion conjugate calculation."""
@@ -50,102 +92,129 @@ class TestQuaternionMath:
         
         result = tss_math.quaternion_conjugate(q)
         
-        assert result[0] == -1
-        assert result[1] == -2
-        assert result[2] == -3
-        assert result[3] == 4
+        np.testing.assert_array_equal(result, [-1, -2, -3, 4])
         
     def test_quaternion_conjugate_identity(self):
         """Test conjugate of identity quaternion."""
-        q = tss_structs.Quaternion(0, 0, 0, 1)
+        q = _IDENTITY_Q
         
         result = tss_math.quaternion_conjugate(q)
         
-        assert result[0] == 0
-        assert result[1] == 0
-        assert result[2] == 0
-        assert result[3] == 1
-        
-    def test_quat_mul_vec_identity(self):
-        """Test quaternion-vector multiplication with identity quaternion."""
-        q = tss_structs.Quaternion(0, 0, 0, 1)  # identity quaternion
-        v = tss_structs.Point(1, 2, 3)
-        
-        result = tss_math.quat_mul_vec(q, v)
+        np.testing.assert_array_equal(result, [0, 0, 0, 1])
         
-        # Identity quaternion should not change the vector
-        assert abs(result[0] - 1.0) < 1e-10
-        assert abs(result[1] - 2.0) < 1e-10
-        assert abs(result[2] - 3.0) < 1e-10
-        
-    def test_quat_mul_vec_rotation(self):
-        """Test quaternion-vector multiplication for a 90-degree rotation around z-axis."""
-        import math
-        # 90-degree rotation around z-axis
-        q = tss_structs.Quaternion(0, 0, math.sin(math.pi/4), math.cos(math.pi/4))
-        v = tss_structs.Point(1, 0, 0)  # unit vector along x-axis
-        
-        result = tss_math.quat_mul_vec(q, v)
-        
-        # Should rotate x-axis to y-axis
-        assert abs(result[0] - 0.0) < 1e-10
-        assert abs(result[1] - 1.0) < 1e-10
-        assert abs(result[2] - 0.0) < 1e-10
+    @pytest.mark.parametrize("q,v,expected", _ROTATE_CASES)
+    def test_quat_mul_vec(self, q, v, expected):
+        """Test quaternion-vector multiplication (identity leaves the vector, z90 maps x to y)."""
+        result = tss_math.quat_mul_vec(tss_structs.Quaternion(*q), tss_structs.Point(*v))
+        np.testing.assert_allclose(result, expected, atol=1e-10)
+
+    def test_quat_mul_vec_batched(self):
+        """Test the batched closed-form rotation agrees with the expected and scalar results."""
+        scalar = [tss_math.quat_mul_vec(q, v) for q, v in zip(_RQ, _RV)]
+        np.testing.assert_allclose(vec_quat_mul_vec(_RQ, _RV), _RV_EXPECTED, atol=1e-10)
+        np.testing.assert_allclose(scalar, _RV_EXPECTED, atol=1e-10)
+
+    def test_quat_mul_vec_batched_random(self, rng):
+        """Test the batched rotation on random unit quaternions and vectors against the scalar one."""
+        Q = rng.standard_normal((64, 4))
+        Q /= np.linalg.norm(Q, axis=1, keepdims=True)
+        V = rng.standard_normal((64, 3))
+        scalar = [tss_math.quat_mul_vec(q, v) for q, v in zip(Q, V)]
+        np.testing.assert_allclose(vec_quat_mul_vec(Q, V), scalar, atol=1e-12)
+
+    @pytest.mark.parametrize("q,v", list(zip(_RANDOM_Q, _RANDOM_V)))
+    def test_quat_mul_vec_matches_closed_form(self, q, v):
+        """Test quaternion-vector multiplication against the rotation-matrix closed form."""
+        result = tss_math.quat_mul_vec(tss_structs.Quaternion(*q), tss_structs.Point(*v))
+        np.testing.assert_allclose(result, _rot_ref(q, v), atol=1e-10)
 
+    @pytest.mark.parametrize("q,v", [
+        ((0, 0, 1, 1), (1, 0, 0)),  # |q|^2 = 2
+        ((0, 0, 0.707, 0.707), (1, 0, 0)),  # rounded sample-config orientation
+        ((0, 0, 0, 2), (1, 2, 3)),  # scaled identity
+        ((0, 0, 0, 0), (1, 2, 3)),  # zero quaternion
+    ])
+    def test_quat_mul_vec_non_unit(self, q, v):
+        """Test non-unit quaternions give the same result as the two Hamilton products q * (v, 0) * q*."""
+        expected = tss_math.quaternion_multiply(
+            tss_math.quaternion_multiply(q, (*v, 0.)), tss_math.quaternion_conjugate(q))[:3]
+        result = tss_math.quat_mul_vec(tss_structs.Quaternion(*q), tss_structs.Point(*v))
+        np.testing.assert_allclose(result, expected, atol=1e-12)
 
 class TestQuaternionUtilities:
     """Test additional quaternion utility functions."""
     
-    def test_quaternion_slerp_different_quaternions(self):
-        """Test spherical linear interpolation with different quaternions."""
-        q1 = tss_structs.Quaternion(0, 0, 0, 1)  # identity
-        q2 = tss_structs.Quaternion(0, 0, 0.707, 0.707)  # 90 degree rotation around z
+    @pytest.mark.parametrize("t,q1,q2,expected", _SLERP_CASES)
+    def test_quaternion_slerp(self, t, q1, q2, expected):
+        """Test spherical linear interpolation at the endpoints and along the arc."""
+        result = tss_math.quaternion_slerp(tss_structs.Quaternion(*q1), tss_structs.Quaternion(*q2), t)
+        
+        arr = np.asarray(result)
+        assert arr.shape == (4,) and arr.dtype.kind == 'f'
+        np.testing.assert_allclose(result, expected, atol=1e-10)
+        
+    def test_quaternion_slerp_fast_path(self):
+        """Test nearly parallel quaternions fall back to a normalized lerp instead of NaN."""
+        q1 = np.array([0, 0, 0, 1], dtype=np.float64)
+        q2 = np.array([1e-8, 0, 0, 1], dtype=np.float64)
+        q2 /= np.linalg.norm(q2)
+        expected = 0.5 * q1 + 0.5 * q2
+        expected /= np.linalg.norm(expected)
+        
+        result = tss_math.quaternion_slerp(tss_structs.Quaternion(*q1), tss_structs.Quaternion(*q2), 0.5)
+        
+        np.testing.assert_allclose(result, expected, atol=1e-12)
+        
+    def test_quaternion_slerp_shortest_arc(self):
+        """Test a negative dot product negates q2 so slerp takes the shorter arc."""
+        q1 = _IDENTITY_Q
+        q2 = tss_structs.Quaternion(0, 0, -_SQRT2_2, -_SQRT2_2)  # 90 degrees around z, opposite hemisphere
+        
+        result = tss_math.quaternion_slerp(q1, q2, 0.5)
+        
+        np.testing.assert_allclose(result, [0, 0, math.sin(math.pi/8), math.cos(math.pi/8)], atol=1e-10)
+        
+    def test_quaternion_slerp_antipodal(self):
+        """Test q2 ~ -q1 (the same rotation) gives a unit quaternion instead of NaN."""
+        q1 = _IDENTITY_Q
+        q2 = tss_structs.Quaternion(0, 0, 0, -1 + 1e-12)
         
         result = tss_math.quaternion_slerp(q1, q2, 0.5)
         
-        # Result should be between q1 and q2
-        assert isinstance(result[0], (int, float))
-        assert isinstance(result[1], (int, float))
-        assert isinstance(result[2], (int, float))
-        assert isinstance(result[3], (int, float))
+        assert not np.any(np.isnan(result))
+        np.testing.assert_allclose(np.linalg.norm(result), 1.0, atol=1e-12)
         
-    def test_quaternion_slerp_interpolation(self):
-        """Test spherical linear interpolation between different quaternions."""
-        q1 = tss_structs.Quaternion(0, 0, 0, 1)  # identity
-        q2 = tss_structs.Quaternion(1, 0, 0, 0)  # 180 degree rotation around x
+    def test_quaternion_slerp_near_identical(self):
+        """Test inputs with dot > 0.9995 match lerp-then-normalize exactly."""
+        q1 = np.array([0, 0, 0, 1], dtype=np.float64)
+        q2 = np.array([0, 0, math.sin(0.01), math.cos(0.01)], dtype=np.float64)
+        assert np.dot(q1, q2) > 0.9995
+        t = 0.3
+        expected = (1-t) * q1 + t * q2
+        expected /= np.linalg.norm(expected)
         
-        # At t=0, should return q1
-        result_0 = tss_math.quaternion_slerp(q1, q2, 0.0)
-        assert abs(result_0[3] - 1.0) < 1e-6
+        result = tss_math.quaternion_slerp(tss_structs.Quaternion(*q1), tss_structs.Quaternion(*q2), t)
         
-        # At t=1, should return q2 (or close to it)
-        result_1 = tss_math.quaternion_slerp(q1, q2, 1.0)
-        assert abs(result_1[0]) > 0.5  # Should have significant x component
+        np.testing.assert_array_equal(result, expected)
         
     def test_quaternion_matrix_identity(self):
         """Test rotation matrix for identity quaternion."""
-        q = tss_structs.Quaternion(0, 0, 0, 1)
+        q = _IDENTITY_Q
         
         matrix = tss_math.quaternion_matrix(q)
         
         # Should be identity matrix
-        expected = [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
-        for i in range(3):
-            for j in range(3):
-                assert abs(matrix[i][j] - expected[i][j]) < 1e-10
+        np.testing.assert_allclose(np.asarray(matrix), _EYE3, atol=1e-10)
                 
     def test_quaternion_matrix_x_rotation(self):
         """Test rotation matrix for 90-degree rotation around x-axis."""
-        import math
         # 90-degree rotation around x-axis
-        q = tss_structs.Quaternion(math.sin(math.pi/4), 0, 0, math.cos(math.pi/4))
+        q = tss_structs.Quaternion(_SQRT2_2, 0, 0, _SQRT2_2)
         
         matrix = tss_math.quaternion_matrix(q)
         
-        # Check that y-axis rotates to z-axis
-        assert abs(matrix[0][0] - 1.0) < 1e-10  # x unchanged
-        assert abs(matrix[1][2] - (-1.0)) < 1e-10  # y -> -z
-        assert abs(matrix[2][1] - 1.0) < 1e-10   # z -> y
+        # x unchanged, y-axis rotates to z-axis, z-axis rotates to -y
+        np.testing.assert_allclose(matrix, [[1, 0, 0], [0, 0, -1], [0, 1, 0]], atol=1e-10)
 
 
 class TestEulerConversions:
@@ -156,54 +225,70 @@ class TestEulerConversions:
         q = tss_math.quaternion_from_euler(0, 0, 0)
         
         # Should be identity quaternion
-        assert abs(q[0]) < 1e-10
-        assert abs(q[1]) < 1e-10
-        assert abs(q[2]) < 1e-10
-        assert abs(q[3] - 1.0) < 1e-10
-        
-    def test_quaternion_from_euler_x_rotation(self):
-        """Test quaternion from 90-degree rotation around x-axis."""
-        import math
-        q = tss_math.quaternion_from_euler(math.pi/2, 0, 0)
-        
-        # Should have significant x component
-        assert abs(q[0] - math.sin(math.pi/4)) < 1e-10
-        assert abs(q[1]) < 1e-10
-        assert abs(q[2]) < 1e-10
-        assert abs(q[3] - math.cos(math.pi/4)) < 1e-10
+        np.testing.assert_allclose(q, [0, 0, 0, 1], atol=1e-10)
+        
+    def test_quaternion_from_euler_zero_returns_cached_identity(self):
+        """Test zero Euler angles return the shared identity without any trig."""
+        assert tss_math.quaternion_from_euler(0, 0, 0) is tss_math._IDENTITY_Q
+        assert all(type(c) is np.float64 for c in tss_math.quaternion_from_euler(0, 0, 0))
+        
+    def test_quaternion_from_euler_array_angles(self):
+        """Test array angles skip the scalar identity shortcut and convert elementwise."""
+        q = tss_math.quaternion_from_euler(np.array([0., math.pi/2]), np.zeros(2), np.zeros(2))
+        
+        np.testing.assert_allclose(np.stack(q, axis=-1), [[0, 0, 0, 1], [_SQRT2_2, 0, 0, _SQRT2_2]], atol=1e-10)
+        
+    def test_euler_from_quaternion_identity_returns_cached_zero(self):
+        """Test the identity quaternion (either sign) returns the shared zero angles."""
+        assert tss_math.euler_from_quaternion(_IDENTITY_Q) is tss_math._ZERO_EULER
+        assert tss_math.euler_from_quaternion((0., 0., 0., -1.)) is tss_math._ZERO_EULER
+        assert all(type(c) is np.float64 for c in tss_math.euler_from_quaternion(_IDENTITY_Q))
+        
+    @pytest.mark.parametrize("axis,angle", [('x', math.pi/2), ('y', math.pi/3), ('z', math.pi/4), ('x', 0.0)])
+    def test_quaternion_from_euler_axis(self, axis, angle):
+        """Test quaternion from a single-axis rotation equals (sin(a/2) * e_axis, cos(a/2))."""
+        euler = [0., 0., 0.]
+        euler[_AXIS[axis]] = angle
+        expected = [0., 0., 0., math.cos(angle/2)]
+        expected[_AXIS[axis]] = math.sin(angle/2)
+        
+        q = tss_math.quaternion_from_euler(*euler)
+        
+        np.testing.assert_allclose(q, expected, atol=1e-10)
         
     def test_euler_from_matrix_identity(self):
         """Test Euler angles from identity matrix."""
-        identity = [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
-        
-        euler = tss_math.euler_from_matrix(identity)
+        euler = tss_math.euler_from_matrix(_EYE3)
         
-        assert abs(euler[0]) < 1e-10
-        assert abs(euler[1]) < 1e-10
-        assert abs(euler[2]) < 1e-10
+        np.testing.assert_allclose(euler, [0, 0, 0], atol=1e-10)
         
     def test_euler_from_quaternion_identity(self):
         """Test Euler angles from identity quaternion."""
-        q = tss_structs.Quaternion(0, 0, 0, 1)
+        q = _IDENTITY_Q
         
-        euler = tss_math.euler_from_quaternion(q)
+        euler = euler_from_quaternion_direct(q)
         
-        assert abs(euler[0]) < 1e-10
-        assert abs(euler[1]) < 1e-10
-        assert abs(euler[2]) < 1e-10
+        np.testing.assert_allclose(euler, [0, 0, 0], atol=1e-10)
+        np.testing.assert_allclose(tss_math.euler_from_quaternion(q), euler, atol=1e-10)
         
     def test_euler_quaternion_roundtrip(self):
         """Test roundtrip conversion between Euler angles and quaternions."""
-        import math
-        original_x, original_y, original_z = math.pi/6, math.pi/4, math.pi/3
+        original = (math.pi/6, math.pi/4, math.pi/3)
         
-        q = tss_math.quaternion_from_euler(original_x, original_y, original_z)
-        result_euler = tss_math.euler_from_quaternion(q)
+        q = tss_math.quaternion_from_euler(*original)
         
-        # Allow for some numerical precision issues
-        assert abs(original_x - result_euler[0]) < 1e-10
-        assert abs(original_y - result_euler[1]) < 1e-10
-        assert abs(original_z - result_euler[2]) < 1e-10
+        np.testing.assert_allclose(euler_from_quaternion_direct(q), original, atol=1e-10)
+        np.testing.assert_allclose(tss_math.euler_from_quaternion(q), original, atol=1e-10)
+
+    @pytest.mark.parametrize("pitch", [math.pi/2, -math.pi/2])
+    def test_euler_from_quaternion_gimbal_lock(self, pitch):
+        """Test Euler angles at gimbal lock still describe the original rotation."""
+        q = tss_math.quaternion_from_euler(0.2, pitch, 0.5)
+        
+        for euler in (euler_from_quaternion_direct(q), tss_math.euler_from_quaternion(q)):
+            np.testing.assert_allclose(euler[1], pitch, atol=1e-10)
+            # q and -q are the same rotation
+            np.testing.assert_allclose(abs(np.dot(tss_math.quaternion_from_euler(*euler), q)), 1.0, atol=1e-10)
 
 
 class TestDirectionMath:
@@ -211,49 +296,58 @@ class TestDirectionMath:
     
     def test_proper_trifunc_clipping(self):
         """Test proper_trifunc clips values to [-1, 1] range."""
-        assert tss_math.proper_trifunc(2) == 1
-        assert tss_math.proper_trifunc(-2) == -1
-        assert tss_math.proper_trifunc(0.5) == 0.5
-        assert tss_math.proper_trifunc(-0.5) == -0.5
-        assert tss_math.proper_trifunc(1) == 1
-        assert tss_math.proper_trifunc(-1) == -1
+        src = np.array([2, -2, 0.5, -0.5, 1, -1])
+        expected = np.array([1, -1, 0.5, -0.5, 1, -1])
+        np.testing.assert_array_equal(tss_math.proper_trifunc(src), expected)
+        np.testing.assert_array_equal([tss_math.proper_trifunc(float(v)) for v in src], expected)
+        # NaN passes through both paths instead of being clipped to a valid cosine
+        assert np.isnan(tss_math.proper_trifunc(np.array([np.nan])))[0]
+        assert math.isnan(tss_math.proper_trifunc(math.nan))
         
     def test_xyz2polar_unit_vectors(self):
         """Test conversion to polar coordinates for unit vectors."""
-        import numpy as np
-        import math
-        
         # Unit vector along z-axis
-        xyz = np.array([0, 0, 1])
+        xyz = np.array([0., 0., 1.], dtype=np.float64)
         r, theta, phi = tss_math.xyz2polar(xyz)
         
-        assert abs(r - 1.0) < 1e-10
-        assert abs(theta - 0.0) < 1e-10  # theta should be 0 for z-axis
+        np.testing.assert_allclose([r, theta], [1.0, 0.0], atol=1e-10)  # theta should be 0 for z-axis
         
         # Unit vector along x-axis
-        xyz = np.array([1, 0, 0])
+        xyz = np.array([1., 0., 0.], dtype=np.float64)
         r, theta, phi = tss_math.xyz2polar(xyz)
         
-        assert abs(r - 1.0) < 1e-10
-        assert abs(theta - math.pi/2) < 1e-10  # theta should be pi/2 for x-axis
-        assert abs(phi - 0.0) < 1e-10  # phi should be 0 for x-axis
+        # theta should be pi/2 and phi 0 for x-axis
+        np.testing.assert_allclose([r, theta, phi], [1.0, math.pi/2, 0.0], atol=1e-10)
         
     def test_xyz2dist_ang_unit_vectors(self):
         """Test conversion to distance-angle coordinates for unit vectors."""
-        import numpy as np
-        import math
-        
         # Unit vector along z-axis
-        xyz = np.array([0, 0, 1])
+        xyz = np.array([0., 0., 1.], dtype=np.float64)
         r, theta, phi = tss_math.xyz2dist_ang(xyz)
         
-        assert abs(r - 1.0) < 1e-10
-        assert abs(theta - math.pi/2) < 1e-10  # theta should be pi/2 for z-axis
+        np.testing.assert_allclose([r, theta], [1.0, math.pi/2], atol=1e-10)  # theta should be pi/2 for z-axis
         
         # Unit vector in xy-plane
-        xyz = np.array([1, 0, 0])
+        xyz = np.array([1., 0., 0.], dtype=np.float64)
         r, theta, phi = tss_math.xyz2dist_ang(xyz)
         
-        assert abs(r - 1.0) < 1e-10
-        assert abs(theta - 0.0) < 1e-10  # theta should be 0 for xy-plane
-        assert abs(phi - 0.0) < 1e-10  # phi should be 0 for x-axis
\ No newline at end of file
+        # theta should be 0 for xy-plane and phi 0 for x-axis
+        np.testing.assert_allclose([r, theta, phi], [1.0, 0.0, 0.0], atol=1e-10)
+        
+    def test_xyz2polar_batched(self):
+        """Test polar conversion broadcasts over a stack of vectors."""
+        r, theta, phi = tss_math.xyz2polar(_UNIT_XYZ)
+        
+        assert r.shape == theta.shape == phi.shape == (3,)
+        np.testing.assert_allclose(r, [1.0, 1.0, 1.0], atol=1e-10)
+        np.testing.assert_allclose(theta, [0.0, math.pi/2, math.pi/2], atol=1e-10)
+        np.testing.assert_allclose(phi, [0.0, 0.0, math.pi/2], atol=1e-10)
+        
+    def test_xyz2dist_ang_batched(self):
+        """Test distance-angle conversion broadcasts over a stack of vectors."""
+        r, theta, phi = tss_math.xyz2dist_ang(2. * _UNIT_XYZ)
+        
+        assert r.shape == theta.shape == phi.shape == (3,)
+        np.testing.assert_allclose(r, [2.0, 2.0, 2.0], atol=1e-10)
+        np.testing.assert_allclose(theta, [math.pi/2, 0.0, 0.0], atol=1e-10)
+        np.testing.assert_allclose(phi, [0.0, 0.0, math.pi/2], atol=1e-10)
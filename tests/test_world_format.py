@@ -6,17 +6,27 @@
 """Tests for tasqsym.core.common.world_format module."""
 
 import pytest
-import sys
-import os
-from unittest.mock import Mock
-
-# Add src to Python path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from collections import namedtuple
 
 import tasqsym.core.common.world_format as world_format
 import tasqsym.core.common.structs as tss_structs
 import tasqsym.core.common.constants as tss_constants
 
+_StateStruct = namedtuple('StateStruct', ['position', 'velocity', 'acceleration'])
+_JointState = namedtuple('JointState', ['angle', 'velocity', 'torque'])
+_RobotStates = namedtuple('RobotStates', ['joint1', 'joint2', 'joint3'])
+_PropStruct = namedtuple('PropStruct', ['mass', 'length', 'material'])
+_PhysicalProps = namedtuple('PhysicalProps', ['density', 'youngs_modulus', 'thermal_conductivity'])
+_ManipProps = namedtuple('ManipProps', ['max_payload', 'reach', 'repeatability'])
+_WorkspaceProps = namedtuple('WorkspaceProps', ['min_x', 'max_x', 'min_y', 'max_y', 'min_z', 'max_z'])
+_EmptyStruct = namedtuple('EmptyStruct', [])
+_SingleStruct = namedtuple('SingleStruct', ['value'])
+
+
+class _FakeAction:
+    """Stand-in for a RobotAction; only solveby_type is ever read."""
+    __slots__ = ('solveby_type',)
+
 
 class TestWorldFormat:
     """Test world format data structures."""
@@ -32,7 +42,7 @@ class TestWorldFormat:
         combined_state = tss_structs.CombinedRobotState({"robot1": robot_state})
         
         # Create sample robot actions
-        fk_action = Mock()
+        fk_action = _FakeAction()
         fk_action.solveby_type = tss_constants.SolveByType.FORWARD_KINEMATICS
         combined_action = tss_structs.CombinedRobotAction("test_task", {"robot1": [fk_action]})
         
@@ -57,7 +67,7 @@ class TestWorldFormat:
         robot_state = tss_structs.RobotState(base_pose)
         combined_state = tss_structs.CombinedRobotState({"robot1": robot_state})
         
-        fk_action = Mock()
+        fk_action = _FakeAction()
         combined_action = tss_structs.CombinedRobotAction("original_task", {"robot1": [fk_action]})
         
         status = tss_structs.Status(tss_constants.StatusFlags.SUCCESS)
@@ -70,13 +80,27 @@ class TestWorldFormat:
         # Combined struct should have original values
         assert combined_struct.desired_actions.task == "original_task"
         
+    def test_combined_robot_struct_shares_actions(self):
+        """Test that CombinedRobotStruct copies the action containers but shares the actions themselves."""
+        base_pose = tss_structs.Pose(
+            position=tss_structs.Point(1, 2, 3),
+            orientation=tss_structs.Quaternion(0, 0, 0, 1)
+        )
+        combined_state = tss_structs.CombinedRobotState({"robot1": tss_structs.RobotState(base_pose)})
+        fk_action = _FakeAction()
+        combined_action = tss_structs.CombinedRobotAction("original_task", {"robot1": [fk_action]})
+        
+        combined_struct = world_format.CombinedRobotStruct(
+            combined_state, combined_action, tss_structs.Status(tss_constants.StatusFlags.SUCCESS))
+        combined_action.actions["robot1"].append(_FakeAction())
+        combined_action.actions["robot2"] = []
+        
+        assert combined_struct.desired_actions.actions == {"robot1": [fk_action]}
+        assert combined_struct.desired_actions.actions["robot1"][0] is fk_action
+        
     def test_functional_states_creation(self):
         """Test creating FunctionalStates."""
-        from collections import namedtuple
-        
-        # Create a sample named tuple for states
-        StateStruct = namedtuple('StateStruct', ['position', 'velocity', 'acceleration'])
-        sample_states = StateStruct(position=1.5, velocity=0.8, acceleration=0.1)
+        sample_states = _StateStruct(position=1.5, velocity=0.8, acceleration=0.1)
         
         functional_states = world_format.FunctionalStates(sample_states)
         
@@ -87,16 +111,10 @@ class TestWorldFormat:
         
     def test_functional_states_with_complex_data(self):
         """Test FunctionalStates with complex nested data."""
-        from collections import namedtuple
-        
-        # Create complex state structure
-        JointState = namedtuple('JointState', ['angle', 'velocity', 'torque'])
-        RobotStates = namedtuple('RobotStates', ['joint1', 'joint2', 'joint3'])
-        
-        joint_states = RobotStates(
-            joint1=JointState(1.0, 0.5, 10.0),
-            joint2=JointState(2.0, 0.3, 15.0),
-            joint3=JointState(1.5, 0.1, 8.0)
+        joint_states = _RobotStates(
+            joint1=_JointState(1.0, 0.5, 10.0),
+            joint2=_JointState(2.0, 0.3, 15.0),
+            joint3=_JointState(1.5, 0.1, 8.0)
         )
         
         functional_states = world_format.FunctionalStates(joint_states)
@@ -107,11 +125,7 @@ class TestWorldFormat:
         
     def test_component_properties_creation(self):
         """Test creating ComponentProperties."""
-        from collections import namedtuple
-        
-        # Create a sample named tuple for properties
-        PropStruct = namedtuple('PropStruct', ['mass', 'length', 'material'])
-        sample_properties = PropStruct(mass=2.5, length=0.8, material="aluminum")
+        sample_properties = _PropStruct(mass=2.5, length=0.8, material="aluminum")
         
         component_props = world_format.ComponentProperties(sample_properties)
         
@@ -122,11 +136,7 @@ class TestWorldFormat:
         
     def test_component_properties_with_physical_data(self):
         """Test ComponentProperties with physical properties."""
-        from collections import namedtuple
-        
-        # Create physical properties structure
-        PhysicalProps = namedtuple('PhysicalProps', ['density', 'youngs_modulus', 'thermal_conductivity'])
-        physical_data = PhysicalProps(
+        physical_data = _PhysicalProps(
             density=2700.0,  # kg/m^3 for aluminum
             youngs_modulus=70e9,  # Pa
             thermal_conductivity=237.0  # W/m·K
@@ -140,11 +150,7 @@ class TestWorldFormat:
         
     def test_manipulation_properties_creation(self):
         """Test creating ManipulationProperties."""
-        from collections import namedtuple
-        
-        # Create manipulation-specific properties
-        ManipProps = namedtuple('ManipProps', ['max_payload', 'reach', 'repeatability'])
-        manip_data = ManipProps(
+        manip_data = _ManipProps(
             max_payload=10.0,  # kg
             reach=0.85,  # meters
             repeatability=0.05  # mm
@@ -159,11 +165,7 @@ class TestWorldFormat:
         
     def test_manipulation_properties_with_workspace_data(self):
         """Test ManipulationProperties with workspace definitions."""
-        from collections import namedtuple
-        
-        # Create workspace properties
-        WorkspaceProps = namedtuple('WorkspaceProps', ['min_x', 'max_x', 'min_y', 'max_y', 'min_z', 'max_z'])
-        workspace_data = WorkspaceProps(
+        workspace_data = _WorkspaceProps(
             min_x=-0.5, max_x=0.5,
             min_y=-0.8, max_y=0.8,
             min_z=0.0, max_z=1.2
@@ -180,10 +182,7 @@ class TestWorldFormat:
         
     def test_empty_namedtuple_handling(self):
         """Test handling of empty named tuples."""
-        from collections import namedtuple
-        
-        EmptyStruct = namedtuple('EmptyStruct', [])
-        empty_data = EmptyStruct()
+        empty_data = _EmptyStruct()
         
         functional_states = world_format.FunctionalStates(empty_data)
         component_props = world_format.ComponentProperties(empty_data)
@@ -195,10 +194,7 @@ class TestWorldFormat:
         
     def test_single_field_namedtuple(self):
         """Test handling of single field named tuples."""
-        from collections import namedtuple
-        
-        SingleStruct = namedtuple('SingleStruct', ['value'])
-        single_data = SingleStruct(value=42)
+        single_data = _SingleStruct(value=42)
         
         functional_states = world_format.FunctionalStates(single_data)
         